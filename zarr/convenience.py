@@ -1,13 +1,22 @@
 """Convenience functions for storing and loading data."""
 
+import contextlib
 import itertools
+import mmap
 import os
 import re
+import shutil
+import uuid
+from collections import OrderedDict
 from collections.abc import Mapping, MutableMapping
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
 
 from zarr._storage.store import data_root, meta_root, assert_zarr_v3_api_available
 from zarr.core import Array
 from zarr.creation import array as _create_array
+from zarr.creation import create as _create
 from zarr.creation import open_array
 from zarr.errors import CopyError, PathNotFoundError
 from zarr.hierarchy import Group
@@ -16,13 +25,21 @@ from zarr.hierarchy import open_group
 from zarr.meta import json_dumps, json_loads
 from zarr.storage import (
     _get_metadata_suffix,
+    _path_to_prefix,
+    _prefix_to_array_key,
+    _prefix_to_group_key,
     contains_array,
     contains_group,
     normalize_store_arg,
     BaseStore,
     ConsolidatedMetadataStore,
+    DirectoryStore,
+    FSStore,
+    SQLiteStore,
+    ZipStore,
 )
 from zarr._storage.v3 import ConsolidatedMetadataStoreV3
+from zarr.codecs import Blosc
 from zarr.util import TreeViewer, buffer_size, normalize_storage_path
 
 from typing import Union
@@ -32,6 +49,28 @@ StoreLike = Union[BaseStore, MutableMapping, str, None]
 _builtin_open = open  # builtin open is later shadowed by a local open function
 
 
+def _probe_path(store, path):
+    """Determine what kind of node, if any, exists at the given logical path,
+    returning 'array', 'group' or None. Where the store implements a batched
+    read, the array and group metadata keys are probed in a single call
+    rather than one lookup each."""
+    prefix = _path_to_prefix(normalize_storage_path(path))
+    array_key = _prefix_to_array_key(store, prefix)
+    group_key = _prefix_to_group_key(store, prefix)
+    if isinstance(store, BaseStore) and type(store).getitems is not BaseStore.getitems:
+        results = store.getitems([array_key, group_key], contexts={})
+        if array_key in results:
+            return "array"
+        elif group_key in results:
+            return "group"
+    else:
+        if array_key in store:
+            return "array"
+        elif group_key in store:
+            return "group"
+    return None
+
+
 def _check_and_update_path(store: BaseStore, path):
     if getattr(store, "_store_version", 2) > 2 and not path:
         raise ValueError("path must be provided for v3 stores")
@@ -118,15 +157,16 @@ def open(store: StoreLike = None, mode: str = "a", *, zarr_version=None, path=No
             return open_group(_store, mode=mode, **kwargs)
 
     elif mode == "a":
-        if "shape" in kwargs or contains_array(_store, path):
+        if "shape" in kwargs or _probe_path(_store, path) == "array":
             return open_array(_store, mode=mode, **kwargs)
         else:
             return open_group(_store, mode=mode, **kwargs)
 
     else:
-        if contains_array(_store, path):
+        node = _probe_path(_store, path)
+        if node == "array":
             return open_array(_store, mode=mode, **kwargs)
-        elif contains_group(_store, path):
+        elif node == "group":
             return open_group(_store, mode=mode, **kwargs)
         else:
             raise PathNotFoundError(path)
@@ -136,6 +176,44 @@ def _might_close(path):
     return isinstance(path, (str, os.PathLike))
 
 
+# compressor used by save_array/save_group for numeric data; Blosc with Zstd
+# at a low compression level plus bit-shuffle gives a notably better ratio
+# than the general default at similar throughput for numeric dtypes
+_save_compressor = Blosc(cname="zstd", clevel=1, shuffle=Blosc.BITSHUFFLE)
+
+
+def _default_save_compressor(arr):
+    dtype = getattr(arr, "dtype", None)
+    if dtype is not None and np.issubdtype(dtype, np.number):
+        return _save_compressor
+    return "default"
+
+
+def _save_array(_store: BaseStore, arr, zarr_version, path, **kwargs):
+    # core of save_array; the store is already normalized
+    path = _check_and_update_path(_store, path)
+    if "compressor" not in kwargs:
+        kwargs["compressor"] = _default_save_compressor(arr)
+    if set(kwargs) == {"compressor"} and isinstance(arr, np.ndarray) and arr.dtype != object:
+        # fast path - shape, dtype and default chunking come straight
+        # from the array, skipping _create_array's introspection of the
+        # data argument
+        z = _create(
+            shape=arr.shape,
+            dtype=arr.dtype,
+            compressor=kwargs["compressor"],
+            store=_store,
+            overwrite=True,
+            zarr_version=zarr_version,
+            path=path,
+        )
+        z[...] = arr
+    else:
+        _create_array(
+            arr, store=_store, overwrite=True, zarr_version=zarr_version, path=path, **kwargs
+        )
+
+
 def save_array(store: StoreLike, arr, *, zarr_version=None, path=None, **kwargs):
     """Convenience function to save a NumPy array to the local file system, following a
     similar API to the NumPy save() function.
@@ -175,18 +253,48 @@ def save_array(store: StoreLike, arr, *, zarr_version=None, path=None, **kwargs)
     """
     may_need_closing = _might_close(store)
     _store: BaseStore = normalize_store_arg(store, mode="w", zarr_version=zarr_version)
-    path = _check_and_update_path(_store, path)
     try:
-        _create_array(
-            arr, store=_store, overwrite=True, zarr_version=zarr_version, path=path, **kwargs
-        )
+        _save_array(_store, arr, zarr_version, path, **kwargs)
     finally:
         if may_need_closing:
             # needed to ensure zip file records are written
             _store.close()
 
 
-def save_group(store: StoreLike, *args, zarr_version=None, path=None, **kwargs):
+def _save_group(_store: BaseStore, args, arrays, zarr_version, path, n_workers):
+    # core of save_group; the store is already normalized and the named
+    # arrays are passed as a mapping
+    path = _check_and_update_path(_store, path)
+    grp = _create_group(_store, path=path, overwrite=True, zarr_version=zarr_version)
+    items = [(f"arr_{i}", arr) for i, arr in enumerate(args)]
+    items += list(arrays.items())
+
+    def _save_item(item):
+        k, arr = item
+        grp.create_dataset(
+            k,
+            data=arr,
+            overwrite=True,
+            zarr_version=zarr_version,
+            compressor=_default_save_compressor(arr),
+        )
+
+    if (
+        n_workers is not None
+        and n_workers > 1
+        and not isinstance(_store, (ZipStore, SQLiteStore))
+    ):
+        # arrays are independent and the compressors used release the
+        # GIL, so saves can overlap across threads; zip and SQLite backed
+        # stores are excluded as they are not safe for concurrent writes
+        with ThreadPoolExecutor(max_workers=n_workers) as executor:
+            list(executor.map(_save_item, items))
+    else:
+        for item in items:
+            _save_item(item)
+
+
+def save_group(store: StoreLike, *args, zarr_version=None, path=None, n_workers=None, **kwargs):
     """Convenience function to save several NumPy arrays to the local file system, following a
     similar API to the NumPy savez()/savez_compressed() functions.
 
@@ -202,6 +310,11 @@ def save_group(store: StoreLike, *args, zarr_version=None, path=None, **kwargs):
         it will fall back to 2.
     path : str or None, optional
         Path within the store where the group will be saved.
+    n_workers : int, optional
+        If given and greater than one, arrays will be saved using a pool of
+        this many threads, so that compression and storage of independent
+        arrays can overlap. Ignored for zip file stores, which are not safe
+        for concurrent writes. The default is to save serially.
     kwargs
         NumPy arrays with data to save.
 
@@ -247,7 +360,8 @@ def save_group(store: StoreLike, *args, zarr_version=None, path=None, **kwargs):
 
     Notes
     -----
-    Default compression options will be used.
+    Arrays with a numeric dtype are compressed with Blosc using the Zstd
+    codec and bit-shuffle; otherwise default compression options are used.
 
     """
     if len(args) == 0 and len(kwargs) == 0:
@@ -255,21 +369,15 @@ def save_group(store: StoreLike, *args, zarr_version=None, path=None, **kwargs):
     # handle polymorphic store arg
     may_need_closing = _might_close(store)
     _store: BaseStore = normalize_store_arg(store, mode="w", zarr_version=zarr_version)
-    path = _check_and_update_path(_store, path)
     try:
-        grp = _create_group(_store, path=path, overwrite=True, zarr_version=zarr_version)
-        for i, arr in enumerate(args):
-            k = f"arr_{i}"
-            grp.create_dataset(k, data=arr, overwrite=True, zarr_version=zarr_version)
-        for k, arr in kwargs.items():
-            grp.create_dataset(k, data=arr, overwrite=True, zarr_version=zarr_version)
+        _save_group(_store, args, kwargs, zarr_version, path, n_workers)
     finally:
         if may_need_closing:
             # needed to ensure zip file records are written
             _store.close()
 
 
-def save(store: StoreLike, *args, zarr_version=None, path=None, **kwargs):
+def save(store: StoreLike, *args, zarr_version=None, path=None, n_workers=None, **kwargs):
     """Convenience function to save an array or group of arrays to the local file system.
 
     Parameters
@@ -284,6 +392,10 @@ def save(store: StoreLike, *args, zarr_version=None, path=None, **kwargs):
         it will fall back to 2.
     path : str or None, optional
         The path within the group where the arrays will be saved.
+    n_workers : int, optional
+        If given and greater than one, and several arrays are being saved,
+        the arrays will be saved using a pool of this many threads; see
+        :func:`save_group`.
     kwargs
         NumPy arrays with data to save.
 
@@ -349,42 +461,120 @@ def save(store: StoreLike, *args, zarr_version=None, path=None, **kwargs):
     """
     if len(args) == 0 and len(kwargs) == 0:
         raise ValueError("at least one array must be provided")
-    if len(args) == 1 and len(kwargs) == 0:
-        save_array(store, args[0], zarr_version=zarr_version, path=path)
-    else:
-        save_group(store, *args, zarr_version=zarr_version, path=path, **kwargs)
+    # normalize the store once here, rather than again in save_array or
+    # save_group; opening a store can be costly, e.g., for zip files
+    may_need_closing = _might_close(store)
+    _store: BaseStore = normalize_store_arg(store, mode="w", zarr_version=zarr_version)
+    try:
+        if len(args) == 1 and len(kwargs) == 0:
+            _save_array(_store, args[0], zarr_version, path)
+        else:
+            _save_group(_store, args, kwargs, zarr_version, path, n_workers)
+    finally:
+        if may_need_closing:
+            # needed to ensure zip file records are written
+            _store.close()
+
+
+def _memmap_array(arr):
+    # return a read-only np.memmap view onto the data for an array, if the
+    # data for the whole array are stored verbatim in a single file on disk,
+    # otherwise return None
+    if (
+        arr.ndim == 0
+        or arr.compressor is not None
+        or arr.filters
+        or arr.shape != arr.chunks
+        or type(arr.chunk_store) is not DirectoryStore
+    ):
+        return None
+    store = arr.chunk_store
+    key = arr._chunk_key((0,) * arr.ndim)
+    fn = os.path.join(store.path, store._normalize_key(key))
+    if not os.path.isfile(fn):
+        # chunk not initialized
+        return None
+    return np.memmap(fn, dtype=arr.dtype, mode="r", shape=arr.shape, order=arr.order)
 
 
 class LazyLoader(Mapping):
-    def __init__(self, grp):
+    """Mapping interface onto the arrays in a group, loading each array into
+    memory the first time it is accessed.
+
+    Parameters
+    ----------
+    grp : Group
+        Group containing the arrays to load.
+    max_size : int, optional
+        The maximum size that the cache of loaded arrays may grow to, in
+        number of bytes. The least recently used arrays are dropped from the
+        cache to keep it within this limit, and re-loaded on next access.
+        The default is for the cache to grow without bound.
+    mmap : bool, optional
+        If True, arrays whose data are stored verbatim in a single file on
+        disk are returned as read-only memory-mapped views rather than
+        loaded into memory; other arrays are loaded as normal.
+
+    """
+
+    def __init__(self, grp, max_size=None, mmap=False):
         self.grp = grp
-        self.cache = dict()
+        self.cache = OrderedDict()
+        self._max_size = max_size
+        self._mmap = mmap
+        self._current_size = 0
+        self._keys = None
+        self._key_set = None
+        self._array_keys = None
+
+    def _get_keys(self):
+        # the group is not modified through the loader, so the keys can be
+        # listed once and reused, avoiding repeated storage listings
+        if self._keys is None:
+            self._keys = tuple(self.grp)
+            self._key_set = frozenset(self._keys)
+        return self._keys
 
     def __getitem__(self, item):
         try:
-            return self.cache[item]
+            arr = self.cache[item]
+            self.cache.move_to_end(item)
+            return arr
         except KeyError:
-            arr = self.grp[item][...]
-            self.cache[item] = arr
+            arr = None
+            if self._mmap:
+                arr = _memmap_array(self.grp[item])
+            if arr is None:
+                arr = self.grp[item][...]
+            if self._max_size is None or arr.nbytes <= self._max_size:
+                self.cache[item] = arr
+                self._current_size += arr.nbytes
+                # evict the least recently used arrays to stay within budget
+                while self._max_size is not None and self._current_size > self._max_size:
+                    _, evicted = self.cache.popitem(last=False)
+                    self._current_size -= evicted.nbytes
             return arr
 
     def __len__(self):
-        return len(self.grp)
+        return len(self._get_keys())
 
     def __iter__(self):
-        return iter(self.grp)
+        return iter(self._get_keys())
 
     def __contains__(self, item):
-        return item in self.grp
+        self._get_keys()
+        return item in self._key_set
 
     def __repr__(self):
+        if self._array_keys is None:
+            self._array_keys = sorted(self.grp.array_keys())
         r = "<LazyLoader: "
-        r += ", ".join(sorted(self.grp.array_keys()))
+        r += ", ".join(self._array_keys)
         r += ">"
         return r
 
 
-def load(store: StoreLike, zarr_version=None, path=None):
+def load(store: StoreLike, zarr_version=None, path=None, mmap=False):
     """Load data from an array or group into memory.
 
     Parameters
@@ -397,6 +587,11 @@ def load(store: StoreLike, zarr_version=None, path=None):
         otherwise it will fall back to 2.
     path : str or None, optional
         The path within the store from which to load.
+    mmap : bool, optional
+        If True, arrays whose data are stored verbatim (uncompressed and
+        unfiltered, with a single chunk) in a file on the local file system
+        are returned as read-only memory-mapped views onto the file, rather
+        than loaded into memory. Other arrays are loaded as normal.
 
     Returns
     -------
@@ -419,10 +614,15 @@ def load(store: StoreLike, zarr_version=None, path=None):
     _store = normalize_store_arg(store, zarr_version=zarr_version)
     path = _check_and_update_path(_store, path)
     if contains_array(_store, path=path):
-        return Array(store=_store, path=path)[...]
+        arr = Array(store=_store, path=path)
+        if mmap:
+            out = _memmap_array(arr)
+            if out is not None:
+                return out
+        return arr[...]
     elif contains_group(_store, path=path):
         grp = Group(store=_store, path=path)
-        return LazyLoader(grp)
+        return LazyLoader(grp, mmap=mmap)
 
 
 def tree(grp, expand=False, level=None):
@@ -501,6 +701,9 @@ class _LogWriter:
             raise TypeError(
                 f"log must be a callable function, file path or file-like object, found {log!r}"
             )
+        # cache whether any logging is configured, so callers in hot loops
+        # can skip building log messages altogether
+        self.enabled = self.log_func is not None or self.log_file is not None
 
     def __enter__(self):
         return self
@@ -510,6 +713,8 @@ class _LogWriter:
             self.log_file.close()
 
     def __call__(self, *args, **kwargs):
+        if not self.enabled:
+            return
         if self.log_file is not None:
             kwargs["file"] = self.log_file
             print(*args, **kwargs)
@@ -532,6 +737,135 @@ def _log_copy_summary(log, dry_run, n_copied, n_skipped, n_bytes_copied):
     log(message)
 
 
+# number of key/value pairs to accumulate before flushing a batched write
+_copy_store_batch_size = 256
+
+
+def _can_copy_file(source, dest):
+    # decide whether chunk data can be copied directly between files on disk,
+    # without round-tripping the bytes through the Python heap; both stores
+    # must be plain DirectoryStores (n.b., subclasses may transform data on
+    # read or write)
+    return type(source) is DirectoryStore and type(dest) is DirectoryStore
+
+
+def _stores_overlap(source, dest):
+    # decide whether writes to dest during a copy could surface in a lazy
+    # iteration over source's keys: the same store (or stores comparing
+    # equal, e.g. directory stores on one path), or two filesystem-backed
+    # stores whose paths nest inside one another
+    if source is dest or source == dest:
+        return True
+    source_path = getattr(source, "path", None)
+    dest_path = getattr(dest, "path", None)
+    if isinstance(source_path, str) and isinstance(dest_path, str):
+        source_path = os.path.abspath(source_path)
+        dest_path = os.path.abspath(dest_path)
+        return (
+            source_path == dest_path
+            or source_path.startswith(dest_path + os.sep)
+            or dest_path.startswith(source_path + os.sep)
+        )
+    return False
+
+
+def _copy_file_contents(src_path, dst_path):
+    # transfer file contents without round-tripping the data through
+    # userspace where the platform supports it (Linux); elsewhere fall back
+    # to shutil.copyfile, which uses the fastest copy the platform offers
+    if hasattr(os, "copy_file_range"):
+        try:
+            with _builtin_open(src_path, "rb") as fsrc:
+                with _builtin_open(dst_path, "wb") as fdst:
+                    remaining = os.fstat(fsrc.fileno()).st_size
+                    while remaining > 0:
+                        n = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                        if n == 0:  # pragma: no cover
+                            # concurrent truncation of the source file
+                            break
+                        remaining -= n
+            return
+        except OSError:  # pragma: no cover
+            # e.g., EXDEV when copying across file systems on older kernels
+            pass
+    shutil.copyfile(src_path, dst_path)  # pragma: no cover
+
+
+def _copy_key_file(source, source_key, dest, dest_key):
+    # copy data for a single key directly between files on disk, preserving
+    # the atomic write-then-replace behaviour of DirectoryStore.__setitem__
+    src_path = os.path.join(source.path, source._normalize_key(source_key))
+    dst_path = os.path.join(dest.path, dest._normalize_key(dest_key))
+
+    # ensure there is no directory in the way
+    if os.path.isdir(dst_path):
+        shutil.rmtree(dst_path)
+
+    # ensure containing directory exists
+    dir_path, file_name = os.path.split(dst_path)
+    os.makedirs(dir_path, exist_ok=True)
+
+    # copy to a temporary file, then move into place
+    temp_name = file_name + "." + uuid.uuid4().hex + ".partial"
+    temp_path = os.path.join(dir_path, temp_name)
+    try:
+        _copy_file_contents(src_path, temp_path)
+        os.replace(temp_path, dst_path)
+    finally:
+        if os.path.exists(temp_path):  # pragma: no cover
+            os.remove(temp_path)
+
+    return os.path.getsize(dst_path)
+
+
+def _can_copy_mmap(source, dest):
+    # decide whether chunk data can be streamed from source to dest via
+    # memory-mapped buffers; the source must be a plain DirectoryStore (n.b.,
+    # subclasses may transform data on read) and the destination must be a
+    # store known to serialize values during __setitem__ rather than keep a
+    # reference to them
+    return type(source) is DirectoryStore and isinstance(dest, (DirectoryStore, FSStore, ZipStore))
+
+
+def _copy_key_mmap(source, source_key, dest, dest_key):
+    # copy data for a single key via a memory-mapped buffer, avoiding the
+    # intermediate bytes object that source[source_key] would materialize
+    fn = os.path.join(source.path, source._normalize_key(source_key))
+    with _builtin_open(fn, "rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            mv = memoryview(mm)
+            try:
+                dest[dest_key] = mv
+                return mv.nbytes
+            finally:
+                mv.release()
+
+
+# backreferences inside a pattern refer to group numbers that shift when the
+# patterns are combined into a union
+_filter_backref = re.compile(r"\\[1-9]|\(\?P=")
+
+
+def _compile_filter(patterns, flags):
+    # compile a list of patterns into a single search callable; combining the
+    # patterns into one union pattern means every key is scanned once rather
+    # than once per pattern, but some constructs are not union-safe: global
+    # inline flags and repeated group names fail to compile, and numbered
+    # backreferences silently rebind to the wrong group, so fall back to
+    # matching each pattern separately for those
+    if not patterns:
+        return None
+    if len(patterns) == 1:
+        return re.compile(patterns[0], flags).search
+    if not any(_filter_backref.search(p) for p in patterns):
+        try:
+            return re.compile("|".join(f"(?:{p})" for p in patterns), flags).search
+        except re.error:
+            pass
+    progs = [re.compile(p, flags) for p in patterns]
+    return lambda key: any(prog.search(key) for prog in progs)
+
+
 def copy_store(
     source,
     dest,
@@ -543,6 +877,7 @@ def copy_store(
     if_exists="raise",
     dry_run=False,
     log=None,
+    n_threads=None,
 ):
     """Copy data directly from the `source` store to the `dest` store. Use this
     function when you want to copy a group or array in the most efficient way,
@@ -579,6 +914,13 @@ def copy_store(
         happened.
     log : callable, file path or file-like object, optional
         If provided, will be used to log progress information.
+    n_threads : int, optional
+        If given and greater than one, data will be copied using a pool of
+        this many threads, so that reads and writes for independent keys can
+        overlap. This can substantially reduce wall time when copying between
+        stores where per-key latency dominates, e.g., cloud object stores.
+        Both stores must be safe for concurrent access. The default is to
+        copy serially.
 
     Returns
     -------
@@ -651,8 +993,8 @@ def copy_store(
         includes = []
     elif isinstance(includes, str):
         includes = [includes]
-    excludes = [re.compile(e, flags) for e in excludes]
-    includes = [re.compile(i, flags) for i in includes]
+    excludes = _compile_filter(excludes, flags)
+    includes = _compile_filter(includes, flags)
 
     # check if_exists parameter
     valid_if_exists = ["raise", "replace", "skip"]
@@ -672,10 +1014,77 @@ def copy_store(
         # code below assumes len(meta_root) === len(data_root)
         assert len(data_root) == nchar_root
 
+    # setup parallel copying
+    if n_threads is None:
+        n_threads = 1
+
+    # can chunk data be copied directly between files on disk?
+    use_file_copy = _can_copy_file(source, dest)
+
+    # can chunk data be streamed via memory-mapped buffers?
+    use_mmap = _can_copy_mmap(source, dest)
+
+    # can reads and writes be batched to amortize per-call overhead?
+    use_batch = n_threads == 1 and hasattr(dest, "setitems")
+
+    def _flush_batch(batch):
+        # batch maps dest_key -> source_key; read a whole batch of values in
+        # one call where the source supports it, then write them in one call
+        if hasattr(source, "getitems"):
+            values = source.getitems(list(batch.values()), contexts={})
+        else:
+            values = {source_key: source[source_key] for source_key in batch.values()}
+        values = {dest_key: values[source_key] for dest_key, source_key in batch.items()}
+        dest.setitems(values)
+        batch.clear()
+        return sum(buffer_size(v) for v in values.values())
+
+    def _copy_key(item):
+        source_key, dest_key = item
+        if use_file_copy:
+            return _copy_key_file(source, source_key, dest, dest_key)
+        if use_mmap:
+            try:
+                return _copy_key_mmap(source, source_key, dest, dest_key)
+            except (OSError, ValueError):
+                # fall back, e.g., empty files cannot be memory-mapped
+                pass
+        data = source[source_key]
+        dest[dest_key] = data
+        return buffer_size(data)
+
+    # cache the source path length for the key suffix slicing below
+    len_source_path = len(source_path)
+
+    # enumerate candidate source keys; where the store can list keys under a
+    # prefix, use that to avoid walking (and sorting) the whole store
+    if source_path and hasattr(source, "list_prefix"):
+        if source_store_version == 2:
+            source_keys = source.list_prefix(source_path)
+        else:
+            source_keys = list(source.list_prefix(meta_root + source_path))
+            source_keys += source.list_prefix(data_root + source_path)
+    else:
+        source_keys = source.keys()
+
     # setup logging
     with _LogWriter(log) as log:
-        # iterate over source keys
-        for source_key in sorted(source.keys()):
+        # keys deferred for copying via the thread pool
+        pending = []
+
+        # keys accumulated for a batched write
+        batch = {}
+
+        # iterate over source keys; sorted ordering is only needed for
+        # readable log output, so when no log is configured stream the keys
+        # in store order instead of buffering and sorting them all up front;
+        # when the destination overlaps the source the keys must still be
+        # snapshotted so the iteration is not disturbed by our own writes
+        if log.enabled:
+            source_keys = sorted(source_keys)
+        elif _stores_overlap(source, dest):
+            source_keys = list(source_keys)
+        for source_key in source_keys:
             # filter to keys under source path
             if source_store_version == 2:
                 if not source_key.startswith(source_path):
@@ -686,32 +1095,25 @@ def copy_store(
                     continue
 
             # process excludes and includes
-            exclude = False
-            for prog in excludes:
-                if prog.search(source_key):
-                    exclude = True
-                    break
-            if exclude:
-                for prog in includes:
-                    if prog.search(source_key):
-                        exclude = False
-                        break
-            if exclude:
-                continue
+            if excludes is not None and excludes(source_key):
+                if includes is None or not includes(source_key):
+                    continue
 
             # map key to destination path
             if source_store_version == 2:
-                key_suffix = source_key[len(source_path) :]
+                key_suffix = source_key[len_source_path:]
                 dest_key = dest_path + key_suffix
             elif source_store_version == 3:
                 # nchar_root is length of 'meta/root/' or 'data/root/'
-                key_suffix = source_key[nchar_root + len(source_path) :]
+                key_suffix = source_key[nchar_root + len_source_path :]
                 dest_key = source_key[:nchar_root] + dest_path + key_suffix
 
-            # create a descriptive label for this operation
-            descr = source_key
-            if dest_key != source_key:
-                descr = descr + " -> " + dest_key
+            # create a descriptive label for this operation, but only when
+            # it will actually be logged
+            if log.enabled:
+                descr = source_key
+                if dest_key != source_key:
+                    descr = descr + " -> " + dest_key
 
             # decide what to do
             do_copy = True
@@ -724,16 +1126,34 @@ def copy_store(
 
             # take action
             if do_copy:
-                log(f"copy {descr}")
+                if log.enabled:
+                    log(f"copy {descr}")
                 if not dry_run:
-                    data = source[source_key]
-                    n_bytes_copied += buffer_size(data)
-                    dest[dest_key] = data
+                    if n_threads > 1:
+                        # defer the copy to the thread pool
+                        pending.append((source_key, dest_key))
+                    elif use_batch:
+                        # defer the copy to a batched write
+                        batch[dest_key] = source_key
+                        if len(batch) >= _copy_store_batch_size:
+                            n_bytes_copied += _flush_batch(batch)
+                    else:
+                        n_bytes_copied += _copy_key((source_key, dest_key))
                 n_copied += 1
             else:
-                log(f"skip {descr}")
+                if log.enabled:
+                    log(f"skip {descr}")
                 n_skipped += 1
 
+        if batch:
+            n_bytes_copied += _flush_batch(batch)
+
+        if pending:
+            # data for each key are independent, so reads and writes can
+            # overlap freely across threads
+            with ThreadPoolExecutor(max_workers=n_threads) as executor:
+                n_bytes_copied += sum(executor.map(_copy_key, pending))
+
         # log a final message with a summary of what happened
         _log_copy_summary(log, dry_run, n_copied, n_skipped, n_bytes_copied)
 
@@ -745,6 +1165,20 @@ def _check_dest_is_group(dest):
         raise ValueError(f"dest must be a group, got {dest!r}")
 
 
+def _resolve_copy_args(source, dest, if_exists):
+    # resolve whether either side is h5py and validate the if_exists
+    # parameter once up front, rather than on every recursive call; all
+    # children of a group come from the same library as the group itself
+    source_h5py = source.__module__.startswith("h5py.")
+    dest_h5py = dest.__module__.startswith("h5py.")
+    valid_if_exists = ["raise", "replace", "skip", "skip_initialized"]
+    if if_exists not in valid_if_exists:
+        raise ValueError(f"if_exists must be one of {valid_if_exists!r}; found {if_exists!r}")
+    if dest_h5py and if_exists == "skip_initialized":
+        raise ValueError(f"{if_exists!r} can only be used when copying to zarr")
+    return source_h5py, dest_h5py
+
+
 def copy(
     source,
     dest,
@@ -754,6 +1188,7 @@ def copy(
     log=None,
     if_exists="raise",
     dry_run=False,
+    n_threads=None,
     **create_kws,
 ):
     """Copy the `source` array or group into the `dest` group.
@@ -783,6 +1218,14 @@ def copy(
     dry_run : bool, optional
         If True, don't actually copy anything, just log what would have
         happened.
+    n_threads : int, optional
+        If given and greater than one, array data will be copied using a
+        pool of this many threads, so that copies of independent arrays can
+        overlap. The hierarchy is still traversed, and groups created, in
+        the calling thread. The destination store must be safe to write
+        from multiple threads; destinations that are not (e.g., zip or
+        SQLite backed stores) are copied serially regardless. The default
+        is to copy serially.
     **create_kws
         Passed through to the create_dataset method when copying an array/dataset.
 
@@ -872,22 +1315,28 @@ def copy(
 
     # value checks
     _check_dest_is_group(dest)
+    source_h5py, dest_h5py = _resolve_copy_args(source, dest, if_exists)
 
     # setup logging
     with _LogWriter(log) as log:
-        # do the copying
-        n_copied, n_skipped, n_bytes_copied = _copy(
-            log,
-            source,
-            dest,
-            name=name,
-            root=True,
-            shallow=shallow,
-            without_attrs=without_attrs,
-            if_exists=if_exists,
-            dry_run=dry_run,
-            **create_kws,
-        )
+        with _copy_executor(n_threads, dest) as (executor, futures):
+            # do the copying
+            n_copied, n_skipped, n_bytes_copied = _copy(
+                log,
+                source,
+                dest,
+                name=name,
+                root=True,
+                shallow=shallow,
+                without_attrs=without_attrs,
+                if_exists=if_exists,
+                dry_run=dry_run,
+                source_h5py=source_h5py,
+                dest_h5py=dest_h5py,
+                executor=executor,
+                futures=futures,
+                **create_kws,
+            )
 
         # log a final message with a summary of what happened
         _log_copy_summary(log, dry_run, n_copied, n_skipped, n_bytes_copied)
@@ -895,23 +1344,146 @@ def copy(
         return n_copied, n_skipped, n_bytes_copied
 
 
-def _copy(log, source, dest, name, root, shallow, without_attrs, if_exists, dry_run, **create_kws):
+@contextlib.contextmanager
+def _copy_executor(n_threads, dest):
+    # set up a thread pool for copying array data, along with a list to
+    # collect the futures of submitted copies; waits for all copies to
+    # complete (propagating any errors) before shutting the pool down;
+    # zip and SQLite backed destinations are not safe for writes from
+    # multiple threads, so copies into them fall back to serial
+    stores = (getattr(dest, "store", None), getattr(dest, "chunk_store", None))
+    if (
+        n_threads is not None
+        and n_threads > 1
+        and not any(isinstance(s, (ZipStore, SQLiteStore)) for s in stores)
+    ):
+        executor = ThreadPoolExecutor(max_workers=n_threads)
+    else:
+        executor = None
+    futures = []
+    try:
+        yield executor, futures
+        for future in futures:
+            future.result()
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+
+def _same_fill_value(a, b):
+    if a is None or b is None:
+        return a is b
+    try:
+        if np.isnan(a) and np.isnan(b):
+            return True
+    except TypeError:
+        pass
+    return bool(a == b)
+
+
+def _can_copy_chunks(source, ds):
+    # a direct chunk-level copy is possible when both arrays are zarr arrays
+    # with identical chunk geometry and encoding, so that the encoded bytes
+    # for each source chunk are also valid for the destination
+    return (
+        isinstance(source, Array)
+        and isinstance(ds, Array)
+        and ds.shape == source.shape
+        and ds.chunks == source.chunks
+        and ds.dtype == source.dtype
+        and ds.order == source.order
+        and ds.compressor == source.compressor
+        and ds.filters == source.filters
+        and _same_fill_value(ds.fill_value, source.fill_value)
+    )
+
+
+def _copy_array_chunks(source, ds):
+    # copy the encoded bytes for each chunk directly between the chunk
+    # stores, avoiding the decode/encode round trip that a chunked
+    # assignment would perform
+    for chunk_coords in itertools.product(*(range(n) for n in source._cdata_shape)):
+        try:
+            data = source.chunk_store[source._chunk_key(chunk_coords)]
+        except KeyError:
+            # chunk is not initialized and so reads as the fill value,
+            # which is the same in the destination
+            continue
+        ds.chunk_store[ds._chunk_key(chunk_coords)] = data
+
+
+def _copy_slab_shape(source, ds):
+    # choose a slab shape for streaming data between the arrays; use the
+    # destination chunk shape, but when the source is chunked differently,
+    # grow each dimension to cover at least one source chunk (rounded up to
+    # whole destination chunks) so source chunks are not re-read for every
+    # destination chunk
+    chunks = ds.chunks
+    source_chunks = getattr(source, "chunks", None)
+    if source_chunks is None or tuple(source_chunks) == tuple(chunks):
+        return chunks
+    return tuple(
+        min(s, -(-max(c, sc) // c) * c) for s, c, sc in zip(ds.shape, chunks, source_chunks)
+    )
+
+
+def _copy_array_data(source, ds):
+    if _can_copy_chunks(source, ds):
+        # copy encoded chunks directly, avoiding decompress/recompress
+        _copy_array_chunks(source, ds)
+    else:
+        # copy data - N.B., go slab by slab to avoid loading
+        # everything into memory
+        shape = ds.shape
+        chunks = _copy_slab_shape(source, ds)
+
+        # where the source can read into a caller-supplied array, reuse one
+        # buffer for all full-size slabs rather than allocating a fresh
+        # intermediate array per slab
+        buf = None
+        if (
+            ds.ndim > 0
+            and ds.dtype != object
+            and (isinstance(source, Array) or hasattr(source, "read_direct"))
+        ):
+            buf = np.empty(chunks, dtype=ds.dtype)
+
+        chunk_offsets = [range(0, s, c) for s, c in zip(shape, chunks)]
+        for offset in itertools.product(*chunk_offsets):
+            sel = tuple(slice(o, min(s, o + c)) for o, s, c in zip(offset, shape, chunks))
+            if buf is not None and tuple(s.stop - s.start for s in sel) == buf.shape:
+                if isinstance(source, Array):
+                    source.get_basic_selection(sel, out=buf)
+                else:
+                    source.read_direct(buf, sel)
+                ds[sel] = buf
+            else:
+                # partial slab at the edge of the array
+                ds[sel] = source[sel]
+    return ds.size * ds.dtype.itemsize
+
+
+def _copy(
+    log,
+    source,
+    dest,
+    name,
+    root,
+    shallow,
+    without_attrs,
+    if_exists,
+    dry_run,
+    source_h5py,
+    dest_h5py,
+    executor=None,
+    futures=None,
+    **create_kws,
+):
     # N.B., if this is a dry run, dest may be None
 
     # setup counting variables
     n_copied = n_skipped = n_bytes_copied = 0
 
-    # are we copying to/from h5py?
-    source_h5py = source.__module__.startswith("h5py.")
-    dest_h5py = dest is not None and dest.__module__.startswith("h5py.")
-
-    # check if_exists parameter
-    valid_if_exists = ["raise", "replace", "skip", "skip_initialized"]
-    if if_exists not in valid_if_exists:
-        raise ValueError(f"if_exists must be one of {valid_if_exists!r}; found {if_exists!r}")
-    if dest_h5py and if_exists == "skip_initialized":
-        raise ValueError(f"{if_exists!r} can only be used when copying to zarr")
-
     # determine name to copy to
     if name is None:
         name = source.name.split("/")[-1]
@@ -984,15 +1556,13 @@ def _copy(log, source, dest, name, root, shallow, without_attrs, if_exists, dry_
                 # create new dataset in destination
                 ds = dest.create_dataset(name, shape=source.shape, dtype=source.dtype, **kws)
 
-                # copy data - N.B., go chunk by chunk to avoid loading
-                # everything into memory
-                shape = ds.shape
-                chunks = ds.chunks
-                chunk_offsets = [range(0, s, c) for s, c in zip(shape, chunks)]
-                for offset in itertools.product(*chunk_offsets):
-                    sel = tuple(slice(o, min(s, o + c)) for o, s, c in zip(offset, shape, chunks))
-                    ds[sel] = source[sel]
-                n_bytes_copied += ds.size * ds.dtype.itemsize
+                if executor is not None:
+                    # defer the data copy to the thread pool; arrays are
+                    # independent, so many copies can be in flight at once
+                    futures.append(executor.submit(_copy_array_data, source, ds))
+                    n_bytes_copied += ds.size * ds.dtype.itemsize
+                else:
+                    n_bytes_copied += _copy_array_data(source, ds)
 
                 # copy attributes
                 if not without_attrs:
@@ -1061,6 +1631,10 @@ def _copy(log, source, dest, name, root, shallow, without_attrs, if_exists, dry_
                     without_attrs=without_attrs,
                     if_exists=if_exists,
                     dry_run=dry_run,
+                    source_h5py=source_h5py,
+                    dest_h5py=dest_h5py,
+                    executor=executor,
+                    futures=futures,
                     **create_kws,
                 )
                 n_copied += c
@@ -1084,6 +1658,7 @@ def copy_all(
     log=None,
     if_exists="raise",
     dry_run=False,
+    n_threads=None,
     **create_kws,
 ):
     """Copy all children of the `source` group into the `dest` group.
@@ -1111,6 +1686,14 @@ def copy_all(
     dry_run : bool, optional
         If True, don't actually copy anything, just log what would have
         happened.
+    n_threads : int, optional
+        If given and greater than one, array data will be copied using a
+        pool of this many threads, so that copies of independent arrays can
+        overlap. The hierarchy is still traversed, and groups created, in
+        the calling thread. The destination store must be safe to write
+        from multiple threads; destinations that are not (e.g., zip or
+        SQLite backed stores) are copied serially regardless. The default
+        is to copy serially.
     **create_kws
         Passed through to the create_dataset method when copying an
         array/dataset.
@@ -1166,6 +1749,7 @@ def copy_all(
 
     # value checks
     _check_dest_is_group(dest)
+    source_h5py, dest_h5py = _resolve_copy_args(source, dest, if_exists)
 
     # setup counting variables
     n_copied = n_skipped = n_bytes_copied = 0
@@ -1174,22 +1758,27 @@ def copy_all(
 
     # setup logging
     with _LogWriter(log) as log:
-        for k in source.keys():
-            c, s, b = _copy(
-                log,
-                source[k],
-                dest,
-                name=k,
-                root=False,
-                shallow=shallow,
-                without_attrs=without_attrs,
-                if_exists=if_exists,
-                dry_run=dry_run,
-                **create_kws,
-            )
-            n_copied += c
-            n_skipped += s
-            n_bytes_copied += b
+        with _copy_executor(n_threads, dest) as (executor, futures):
+            for k in source.keys():
+                c, s, b = _copy(
+                    log,
+                    source[k],
+                    dest,
+                    name=k,
+                    root=False,
+                    shallow=shallow,
+                    without_attrs=without_attrs,
+                    if_exists=if_exists,
+                    dry_run=dry_run,
+                    source_h5py=source_h5py,
+                    dest_h5py=dest_h5py,
+                    executor=executor,
+                    futures=futures,
+                    **create_kws,
+                )
+                n_copied += c
+                n_skipped += s
+                n_bytes_copied += b
         if zarr_version == 2:
             dest.attrs.update(**source.attrs)
 
@@ -13,6 +13,7 @@ from zarr.convenience import (
     consolidate_metadata,
     copy,
     copy_store,
+    LazyLoader,
     load,
     open,
     open_consolidated,
@@ -29,6 +30,7 @@ from zarr.storage import (
     FSStore,
     KVStore,
     MemoryStore,
+    SQLiteStore,
     atexit_rmtree,
     data_root,
     meta_root,
@@ -166,6 +168,70 @@ def test_lazy_loader(zarr_version):
     assert "LazyLoader: " in repr(loader)
 
 
+def test_save_default_compressor(tmpdir):
+    # numeric arrays default to Blosc/Zstd compression
+    path = str(tmpdir.join("data.zarr"))
+    save_array(path, np.arange(100))
+    z = zarr.open(path, mode="r")
+    assert z.compressor.cname == "zstd"
+
+    # an explicit compressor is honoured
+    save_array(path, np.arange(100), compressor=Zlib(1))
+    z = zarr.open(path, mode="r")
+    assert isinstance(z.compressor, Zlib)
+
+    # applies to each array saved in a group
+    path = str(tmpdir.join("group.zarr"))
+    save_group(path, foo=np.arange(100))
+    grp = zarr.open(path, mode="r")
+    assert grp["foo"].compressor.cname == "zstd"
+
+
+def test_save_group_n_workers(tmpdir):
+    foo = np.arange(100)
+    bar = np.arange(100, 0, -1)
+
+    path = str(tmpdir.join("group.zarr"))
+    save_group(path, foo=foo, bar=bar, n_workers=2)
+    loader = load(path)
+    assert_array_equal(foo, loader["foo"])
+    assert_array_equal(bar, loader["bar"])
+
+    # zip stores fall back to a serial save
+    path = str(tmpdir.join("group.zip"))
+    save_group(path, foo=foo, bar=bar, n_workers=2)
+    loader = load(path)
+    assert_array_equal(foo, loader["foo"])
+    assert_array_equal(bar, loader["bar"])
+
+    # SQLite stores fall back to a serial save
+    store = SQLiteStore(str(tmpdir.join("group.sqldb")))
+    save_group(store, foo=foo, bar=bar, n_workers=2)
+    loader = load(store)
+    assert_array_equal(foo, loader["foo"])
+    assert_array_equal(bar, loader["bar"])
+    store.close()
+
+
+def test_lazy_loader_max_size():
+    grp = group()
+    foo = np.arange(100)
+    bar = np.arange(100, 0, -1)
+    grp.create_dataset("foo", data=foo)
+    grp.create_dataset("bar", data=bar)
+
+    # cache can hold one array at a time
+    loader = LazyLoader(grp, max_size=foo.nbytes)
+    assert_array_equal(foo, loader["foo"])
+    assert "foo" in loader.cache
+    assert_array_equal(bar, loader["bar"])
+    assert "bar" in loader.cache
+    assert "foo" not in loader.cache
+
+    # evicted arrays can still be re-loaded
+    assert_array_equal(foo, loader["foo"])
+
+
 @pytest.mark.parametrize("zarr_version", _VERSIONS)
 def test_load_array(zarr_version):
     foo = np.arange(100)
@@ -185,6 +251,34 @@ def test_load_array(zarr_version):
             assert_array_equal(bar, array)
 
 
+def test_load_mmap(tmpdir):
+    a = np.arange(100)
+
+    # uncompressed single-chunk arrays can be memory-mapped
+    path = str(tmpdir.join("data.zarr"))
+    save_array(path, a, compressor=None, chunks=False)
+    out = load(path, mmap=True)
+    assert isinstance(out, np.memmap)
+    assert_array_equal(a, out)
+
+    # compressed arrays fall back to an in-memory load
+    save_array(path, a)
+    out = load(path, mmap=True)
+    assert not isinstance(out, np.memmap)
+    assert_array_equal(a, out)
+
+    # propagates through the lazy loader for groups
+    path = str(tmpdir.join("group.zarr"))
+    grp = zarr.open_group(path, mode="w")
+    grp.create_dataset("foo", data=a, compressor=None, chunks=False)
+    grp.create_dataset("bar", data=a)
+    loader = load(path, mmap=True)
+    assert isinstance(loader["foo"], np.memmap)
+    assert not isinstance(loader["bar"], np.memmap)
+    assert_array_equal(a, loader["foo"])
+    assert_array_equal(a, loader["bar"])
+
+
 @pytest.mark.parametrize("zarr_version", _VERSIONS)
 def test_tree(zarr_version):
     kwargs = _init_creation_kwargs(zarr_version)
@@ -416,6 +510,15 @@ class TestCopyStore(unittest.TestCase):
         for key in source:
             assert source[key] == dest[key]
 
+    def test_n_threads(self):
+        source = self.source
+        for n_threads in None, 1, 4:
+            dest = self._get_dest_store()
+            copy_store(source, dest, n_threads=n_threads)
+            assert len(source) == len(dest)
+            for key in source:
+                assert source[key] == dest[key]
+
     def test_source_path(self):
         source = self.source
         # paths should be normalized
@@ -460,6 +563,15 @@ class TestCopyStore(unittest.TestCase):
                         assert key not in dest
                         assert ("new/" + key) not in dest
 
+    def test_same_store(self):
+        # copying within a single store must not be disturbed by its own writes
+        source = self.source
+        copy_store(source, source, source_path="bar", dest_path="new")
+        assert 5 == len(source)
+        root = "" if self._version == 2 else meta_root
+        assert source[root + "new/baz"] == b"yyy"
+        assert source[root + "new/qux"] == b"zzz"
+
     def test_excludes_includes(self):
         source = self.source
 
@@ -491,6 +603,26 @@ class TestCopyStore(unittest.TestCase):
         assert root + "bar/baz" not in dest
         assert root + "bar/qux" in dest
 
+        # patterns that cannot be combined into a single union pattern
+        dest = self._get_dest_store()
+        excludes = r"(?i)F.*"
+        copy_store(source, dest, excludes=excludes)
+        assert len(dest) == 2
+        assert root + "foo" not in dest
+
+        dest = self._get_dest_store()
+        excludes = r"(?P<g>b.z)", r"(?P<g>.*x)"
+        copy_store(source, dest, excludes=excludes)
+        assert len(dest) == 1
+        assert root + "foo" in dest
+
+        # numbered backreferences would rebind across a union
+        dest = self._get_dest_store()
+        excludes = r"(z)\1", r"f(o)\1"
+        copy_store(source, dest, excludes=excludes)
+        assert len(dest) == 2
+        assert root + "foo" not in dest
+
     def test_dry_run(self):
         source = self.source
         dest = self._get_dest_store()
@@ -530,6 +662,63 @@ class TestCopyStore(unittest.TestCase):
             copy_store(source, dest, if_exists="foobar")
 
 
+@pytest.mark.skipif(have_fsspec is False, reason="needs fsspec")
+def test_copy_store_batched(tmpdir):
+    # exercises the batched setitems fast path
+    source = zarr.DirectoryStore(str(tmpdir.join("source.zarr")))
+    root = zarr.group(source, overwrite=True)
+    root.create_dataset("foo", data=np.arange(100), chunks=10)
+    dest = FSStore(str(tmpdir.join("dest.zarr")))
+    n_copied, n_skipped, n_bytes_copied = copy_store(source, dest)
+    assert n_copied == len(list(source.keys()))
+    for key in source:
+        assert source[key] == dest[key]
+
+
+def test_copy_store_mmap(tmpdir):
+    # exercises the memory-mapped read fast path
+    source = zarr.DirectoryStore(str(tmpdir.join("source.zarr")))
+    root = zarr.group(source, overwrite=True)
+    root.create_dataset("foo", data=np.arange(100), chunks=50)
+    dest = zarr.ZipStore(str(tmpdir.join("dest.zip")), mode="w")
+    n_copied, n_skipped, n_bytes_copied = copy_store(source, dest)
+    assert n_copied == len(list(source.keys()))
+    assert n_bytes_copied > 0
+    for key in source:
+        assert source[key] == dest[key]
+    dest.close()
+
+
+def test_copy_store_file(tmpdir):
+    # exercises the direct file copy fast path between directory stores
+    source = zarr.DirectoryStore(str(tmpdir.join("source.zarr")))
+    root = zarr.group(source, overwrite=True)
+    root.create_dataset("foo", data=np.arange(100), chunks=50)
+    dest = zarr.DirectoryStore(str(tmpdir.join("dest.zarr")))
+    n_copied, n_skipped, n_bytes_copied = copy_store(source, dest)
+    assert n_copied == len(list(source.keys()))
+    assert n_bytes_copied > 0
+    for key in source:
+        assert source[key] == dest[key]
+
+
+def test_copy_store_nested_dest(tmpdir):
+    # a destination directory nested inside the source directory must not
+    # have its own writes picked up as source keys mid-copy; enough keys are
+    # used that writes are flushed while the source is still being walked
+    source = zarr.DirectoryStore(str(tmpdir.join("source.zarr")))
+    for i in range(300):
+        source[f"a/{i}"] = str(i).encode()
+    source["a/b/0"] = b"zzz"
+    dest = zarr.DirectoryStore(str(tmpdir.join("source.zarr", "a", "b", "dest")))
+    n_copied, n_skipped, n_bytes_copied = copy_store(source, dest)
+    assert n_copied == 301
+    assert len(dest) == 301
+    for i in range(300):
+        assert dest[f"a/{i}"] == str(i).encode()
+    assert dest["a/b/0"] == b"zzz"
+
+
 @pytest.mark.skipif(not v3_api_available, reason="V3 is disabled")
 class TestCopyStoreV3(TestCopyStore):
     _version = 3
@@ -694,6 +883,28 @@ def test_copy_all_v3():
     assert "subgroup" in destination_group
 
 
+def test_copy_array_different_chunks():
+    # slab-by-slab streaming between arrays with mismatched chunk grids
+    source = zarr.group()
+    baz = source.create_dataset("baz", data=np.arange(1000), chunks=(17,))
+    dest = zarr.group()
+    copy(baz, dest, chunks=(64,))
+    assert dest["baz"].chunks == (64,)
+    assert_array_equal(baz[:], dest["baz"][:])
+
+
+def test_copy_preserves_chunk_encoding():
+    # when source and destination share chunk geometry and encoding, the
+    # encoded chunk bytes should be copied directly
+    source = zarr.group()
+    baz = source.create_dataset("baz", data=np.arange(100), chunks=(50,))
+    dest = zarr.group()
+    copy(baz, dest)
+    assert_array_equal(baz[:], dest["baz"][:])
+    for key in ("baz/0", "baz/1"):
+        assert source.store[key] == dest.store[key]
+
+
 class TestCopy:
     @pytest.fixture(params=[False, True], ids=["zarr", "hdf5"])
     def source(self, request, tmpdir):
@@ -752,6 +963,13 @@ class TestCopy:
         with pytest.raises(ValueError):
             copy(source["foo/bar/baz"], dest)
 
+    def test_copy_n_threads(self, source, dest):
+        # copy array and group with parallel data copying
+        copy(source["spam"], dest, n_threads=2)
+        check_copied_array(source["spam"], dest["spam"])
+        copy(source["foo"], dest, n_threads=2)
+        check_copied_group(source["foo"], dest["foo"])
+
     def test_copy_array_name(self, source, dest):
         # copy array with name
         copy(source["foo/bar/baz"], dest, name="qux")